@@ -124,9 +124,8 @@ class ActivityType(BaseModel):
         """Checks for differences between ActivityType instance
         and upstream version
 
-        :returns: A list of swf.models.base.ModelDiff namedtuple describing
-                  differences
-        :rtype: list
+        :returns: differences between local and upstream versions
+        :rtype: swf.models.base.ModelDiff
         """
         try:
             description = self.connection.describe_activity_type(
@@ -86,7 +86,7 @@ class BaseModel(ConnectedSWFObject):
         :rtype: bool
         """
         try:
-            return bool(self._diff == [])
+            return len(self._diff()) == 0
         except DoesNotExistError:
             return False
 
@@ -95,9 +95,8 @@ class BaseModel(ConnectedSWFObject):
         """Returns changes between current model instance, and
         remote object representation
 
-        :returns: A list of swf.models.base.ModelDiff namedtuple describing
-                  differences
-        :rtype: list
+        :returns: differences between local and upstream versions
+        :rtype: swf.models.base.ModelDiff
         """
         return self._diff()
 
@@ -68,9 +68,8 @@ class Domain(BaseModel):
         """Checks for differences between Domain instance
         and upstream version
 
-        :returns: A list of swf.models.base.ModelDiff namedtuple describing
-                  differences
-        :rtype: list
+        :returns: differences between local and upstream versions
+        :rtype: swf.models.base.ModelDiff
         """
         try:
             description = self.connection.describe_domain(self.name)
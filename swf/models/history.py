@@ -262,3 +262,20 @@ class History(object):
             events_history.append(event)
 
         return cls(events=events_history, raw=data)
+
+    @classmethod
+    def from_event_iter(cls, data):
+        """Instantiates a new ``swf.models.history.History`` instance
+        from an iterable of amazon events descriptions.
+
+        Events are built as they are consumed, so the whole raw response
+        never has to be held in memory aside of the built events: the
+        resulting History ``raw`` attribute is therefore left to None.
+
+        :param  data: event descriptions (typically, a paginated amazon response)
+        :type   data: iterable of dict
+
+        :returns: History model instance built upon data description
+        :rtype : swf.model.event.History
+        """
+        return cls(events=[EventFactory(d) for d in data])
@@ -7,12 +7,15 @@
 
 import time
 import json
+import hashlib
+import operator
+import threading
 import collections
 
 from boto.swf.exceptions import SWFResponseError, SWFTypeAlreadyExistsError
 
 from swf.constants import REGISTERED
-from swf.utils import immutable
+from swf.utils import immutable, get_subkey
 from swf.models import BaseModel
 from swf.models.history import History
 from swf.models.base import ModelDiff
@@ -35,6 +38,198 @@ _POLICIES = (
 CHILD_POLICIES = collections.namedtuple('CHILD_POLICY',
                                         ' '.join(_POLICIES))(*_POLICIES)
 
+# Constant time membership tests for child policy validation
+_CHILD_POLICY_SET = frozenset(_POLICIES)
+
+_DEFAULT_CHILD_POLICY = CHILD_POLICIES.TERMINATE
+
+# Remote descriptions are memoized for this many seconds, so that
+# back-to-back exists/changes calls only hit SWF once.
+DESCRIPTION_CACHE_TTL = 5
+
+_descriptions = {}
+_descriptions_epoch = None
+
+
+def _cached_describe(connection, method, *args):
+    """Calls ``connection.<method>(*args)`` and memoizes its response
+    until the current ``DESCRIPTION_CACHE_TTL`` window expires
+
+    Errors are never cached: boto exceptions propagate untouched.
+
+    :param  connection: connection the description is fetched with
+    :type   connection: boto.swf.layer1.Layer1
+
+    :param  method: name of the connection describe method to call
+    :type   method: str
+
+    :rtype: dict
+    """
+    global _descriptions_epoch
+
+    epoch = int(time.time() // DESCRIPTION_CACHE_TTL)
+    if epoch != _descriptions_epoch:
+        # A new window started: every memoized response is stale
+        _descriptions.clear()
+        _descriptions_epoch = epoch
+
+    key = (connection, method) + args
+
+    cached = _descriptions.get(key)
+    if cached is not None and cached[0] == epoch:
+        return cached[1]
+
+    response = getattr(connection, method)(*args)
+    _descriptions[key] = (epoch, response)
+
+    return response
+
+
+def _invalidate(connection, method, *args):
+    """Drops the memoized ``connection.<method>(*args)`` response"""
+    _descriptions.pop((connection, method) + args, None)
+
+
+# Executions started through start_execution(use_cache=True) are remembered
+# for this many seconds, so that a retried call with the very same
+# parameters returns the execution it started instead of starting another
+# one. The remembered run may have closed since: it is not checked again.
+EXECUTION_CACHE_TTL = 60
+
+# At most this many started executions are remembered, oldest are dropped
+EXECUTION_CACHE_SIZE = 1000
+
+# fingerprint -> (started at, owner, run key), oldest first. Only plain
+# values are stored, so that no connection is kept alive by the cache.
+_executions = collections.OrderedDict()
+# Indexes used to forget entries without scanning the whole cache
+_executions_by_owner = {}
+_executions_by_run = {}
+_executions_lock = threading.Lock()
+
+
+def _fingerprint(*values):
+    """Returns a sha256 digest identifying json serializable *values*"""
+    return hashlib.sha256(json.dumps(values, sort_keys=True)).digest()
+
+
+def _run_key(domain_name, workflow_id, run_id):
+    return (domain_name, workflow_id, run_id)
+
+
+def _pop_execution(fingerprint):
+    """Drops a remembered execution and its index entries.
+
+    Must be called with ``_executions_lock`` held.
+    """
+    entry = _executions.pop(fingerprint, None)
+    if entry is None:
+        return
+
+    _, owner, run_key = entry
+    fingerprints = _executions_by_owner.get(owner)
+    if fingerprints is not None:
+        fingerprints.discard(fingerprint)
+        if not fingerprints:
+            del _executions_by_owner[owner]
+
+    if _executions_by_run.get(run_key) == fingerprint:
+        del _executions_by_run[run_key]
+
+
+def _expire_executions(now):
+    """Drops remembered executions older than ``EXECUTION_CACHE_TTL``,
+    and the oldest ones beyond ``EXECUTION_CACHE_SIZE``.
+
+    Entries are kept in start order, so only the dropped ones are visited.
+    Must be called with ``_executions_lock`` held.
+    """
+    while _executions:
+        fingerprint, (started_at, _, _) = next(_executions.iteritems())
+        if (now - started_at < EXECUTION_CACHE_TTL and
+                len(_executions) <= EXECUTION_CACHE_SIZE):
+            break
+        _pop_execution(fingerprint)
+
+
+def _remembered_execution(fingerprint):
+    """Returns the (domain name, workflow id, run id) of the execution
+    started under *fingerprint* less than ``EXECUTION_CACHE_TTL`` seconds
+    ago, or None"""
+    with _executions_lock:
+        _expire_executions(time.time())
+        entry = _executions.get(fingerprint)
+
+    return entry[2] if entry is not None else None
+
+
+def _remember_execution(fingerprint, owner, run_key):
+    """Remembers the execution identified by *run_key*, started under
+    *fingerprint* by the workflow type *owner* (domain name, name, version)"""
+    now = time.time()
+    with _executions_lock:
+        _pop_execution(fingerprint)  # so it moves to the newest end
+        _executions[fingerprint] = (now, owner, run_key)
+        _executions_by_owner.setdefault(owner, set()).add(fingerprint)
+        _executions_by_run[run_key] = fingerprint
+        _expire_executions(now)
+
+
+def _forget_owner_executions(owner):
+    """Drops executions started by the workflow type identified by *owner*"""
+    with _executions_lock:
+        _expire_executions(time.time())
+        for fingerprint in list(_executions_by_owner.get(owner, ())):
+            _pop_execution(fingerprint)
+
+
+def _forget_execution(run_key):
+    """Drops the execution identified by *run_key* from the remembered ones"""
+    with _executions_lock:
+        _expire_executions(time.time())
+        fingerprint = _executions_by_run.get(run_key)
+        if fingerprint is not None:
+            _pop_execution(fingerprint)
+
+
+def _reraise(error, message=None, not_found=('UnknownResourceFault',)):
+    """Translates a boto SWFResponseError into a swf exception
+
+    :param  error: error raised by boto
+    :type   error: boto.swf.exceptions.SWFResponseError
+
+    :param  message: DoesNotExistError message, defaults to amazon's one
+    :type   message: str
+
+    :param  not_found: amazon error codes meaning the resource does not exist
+    :type   not_found: tuple
+
+    :raises: DoesNotExistError if the error code is among ``not_found``,
+             ResponseError otherwise
+    """
+    if error.error_code in not_found:
+        raise DoesNotExistError(message or error.body['message'])
+
+    raise ResponseError(error.body['message'])
+
+
+def _try_describe(describe, message):
+    """Fetches an amazon-side description, translating boto errors
+    the way ``_reraise`` does
+
+    :param  describe: callable returning the description
+    :type   describe: callable
+
+    :param  message: DoesNotExistError message when the resource is unknown
+    :type   message: str
+
+    :rtype: dict
+    """
+    try:
+        return describe()
+    except SWFResponseError as e:
+        _reraise(e, message)
+
 
 class WorkflowTypeDoesNotExist(DoesNotExistError):
     pass
@@ -99,12 +294,27 @@ class WorkflowType(BaseModel):
         'description',
     ]
 
+    # Compared attributes as (diff name, local attribute, path of the
+    # upstream value in amazon's describe_workflow_type response)
+    _DIFF_SPEC = (
+        ('name', 'name', ('typeInfo', 'workflowType', 'name')),
+        ('version', 'version', ('typeInfo', 'workflowType', 'version')),
+        ('status', 'status', ('typeInfo', 'status')),
+        ('creation_date', 'creation_date', ('typeInfo', 'creationDate')),
+        ('deprecation_date', 'deprecation_date', ('typeInfo', 'deprecationDate')),
+        ('task_list', 'task_list', ('configuration', 'defaultTaskList', 'name')),
+        ('child_policy', 'child_policy', ('configuration', 'defaultChildPolicy')),
+        ('execution_timeout', 'execution_timeout', ('configuration', 'defaultExecutionStartToCloseTimeout')),
+        ('decision_tasks_timout', 'decision_tasks_timeout', ('configuration', 'defaultTaskStartToCloseTimeout')),
+        ('description', 'description', ('typeInfo', 'description')),
+    )
+
     def __init__(self, domain, name, version,
                  status=REGISTERED,
                  creation_date=0.0,
                  deprecation_date=0.0,
                  task_list=None,
-                 child_policy=CHILD_POLICIES.TERMINATE,
+                 child_policy=_DEFAULT_CHILD_POLICY,
                  execution_timeout='300',
                  decision_tasks_timeout='300',
                  description=None, *args, **kwargs):
@@ -129,7 +339,8 @@ class WorkflowType(BaseModel):
         super(self.__class__, self).__init__(*args, **kwargs)
 
     def set_child_policy(self, policy):
-        if not policy in CHILD_POLICIES:
+        if (policy is not _DEFAULT_CHILD_POLICY and
+                policy not in _CHILD_POLICY_SET):
             raise ValueError("invalid child policy value: {}".format(policy))
 
         self.child_policy = policy
@@ -138,37 +349,16 @@ class WorkflowType(BaseModel):
         """Checks for differences between WorkflowType instance
         and upstream version
 
-        :returns: A list of swf.models.base.ModelDiff namedtuple describing
-                  differences
-        :rtype: list
+        :returns: differences between local and upstream versions
+        :rtype: swf.models.base.ModelDiff
         """
-        try:
-            description = self.connection.describe_workflow_type(
-                self.domain.name,
-                self.name,
-                self.version
-            )
-        except SWFResponseError as e:
-            if e.error_code == 'UnknownResourceFault':
-                raise DoesNotExistError("Remote Domain does not exist")
-
-            raise ResponseError(e.body['message'])
-
-        workflow_info = description['typeInfo']
-        workflow_config = description['configuration']
-
-        return ModelDiff(
-            ('name', self.name, workflow_info['workflowType']['name']),
-            ('version', self.version, workflow_info['workflowType']['version']),
-            ('status', self.status, workflow_info['status']),
-            ('creation_date', self.creation_date, workflow_info['creationDate']),
-            ('deprecation_date', self.deprecation_date, workflow_info['deprecationDate']),
-            ('task_list', self.task_list, workflow_config['defaultTaskList']['name']),
-            ('child_policy', self.child_policy, workflow_config['defaultChildPolicy']),
-            ('execution_timeout', self.execution_timeout, workflow_config['defaultExecutionStartToCloseTimeout']),
-            ('decision_tasks_timout', self.decision_tasks_timeout, workflow_config['defaultTaskStartToCloseTimeout']),
-            ('description', self.description, workflow_info['description']),
-        )
+        description = _try_describe(self._describe,
+                                    "Remote WorkflowType does not exist")
+
+        return ModelDiff(*(
+            (attr, getattr(self, local), get_subkey(description, path))
+            for attr, local, path in self._DIFF_SPEC
+        ))
 
     @property
     @exceptions.translate(SWFResponseError, to=ResponseError)
@@ -182,12 +372,73 @@ class WorkflowType(BaseModel):
 
         :rtype: bool
         """
-        self.connection.describe_workflow_type(
+        self._describe()
+        return True
+
+    @classmethod
+    def bulk_exists(cls, workflow_types, max_workers=16):
+        """Checks if several WorkflowType exist amazon-side, issuing
+        the describe requests concurrently
+
+        Fetched descriptions are cached, so following ``exists`` or
+        ``changes`` calls over the same workflow types are free.
+
+        :param  workflow_types: workflow types to check
+        :type   workflow_types: list of swf.models.WorkflowType
+
+        :param  max_workers: maximum count of concurrent requests
+        :type   max_workers: int
+
+        :returns: whether each workflow type exists
+        :rtype: dict of swf.models.WorkflowType -> bool
+
+        :raises: ValueError if ``max_workers`` is lower than 1; any error
+                 raised by one of the ``exists`` checks is raised as-is
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1, got {}".format(
+                             max_workers))
+
+        workflow_types = list(workflow_types)
+        if not workflow_types:
+            return {}
+
+        # Only needed here: keeps multiprocessing out of import time
+        from multiprocessing.pool import ThreadPool
+
+        pool = ThreadPool(min(max_workers, len(workflow_types)))
+        try:
+            exist = pool.map(operator.attrgetter('exists'), workflow_types)
+        finally:
+            pool.terminate()
+
+        return dict(zip(workflow_types, exist))
+
+    def _describe(self):
+        """Fetches the workflow type description amazon-side
+
+        Responses are shared with other calls made within the same
+        ``DESCRIPTION_CACHE_TTL`` window.
+
+        :rtype: dict
+        """
+        return _cached_describe(
+            self.connection,
+            'describe_workflow_type',
+            self.domain.name,
+            self.name,
+            self.version
+        )
+
+    def invalidate(self):
+        """Drops the cached amazon-side description of the workflow type"""
+        _invalidate(
+            self.connection,
+            'describe_workflow_type',
             self.domain.name,
             self.name,
             self.version
         )
-        return True
 
     def save(self):
         """Creates the workflow type amazon side"""
@@ -205,16 +456,22 @@ class WorkflowType(BaseModel):
         except SWFTypeAlreadyExistsError:
             raise AlreadyExistsError("Workflow type %s already exists amazon-side" % self.name)
         except SWFResponseError as e:
-            if e.error_code == 'UnknownResourceFault':
-                raise DoesNotExistError(e.body['message'])
+            _reraise(e)
+        finally:
+            # Only once amazon-side state changed, so that no concurrent
+            # describe can cache the former one again
+            self.invalidate()
 
     def delete(self):
         """Deprecates the workflow type amazon-side"""
         try:
             self.connection.deprecate_workflow_type(self.domain.name, self.name, self.version)
         except SWFResponseError as e:
-            if e.error_code in ['UnknownResourceFault', 'TypeDeprecatedFault']:
-                raise DoesNotExistError(e.body['message'])
+            _reraise(e, not_found=('UnknownResourceFault',
+                                   'TypeDeprecatedFault'))
+        finally:
+            self.invalidate()
+            _forget_owner_executions((self.domain.name, self.name, self.version))
 
     def upstream(self):
         from swf.querysets.workflow import WorkflowTypeQuerySet
@@ -223,10 +480,13 @@ class WorkflowType(BaseModel):
 
     def start_execution(self, workflow_id=None, task_list=None,
                         child_policy=None, execution_timeout=None,
-                        input=None, tag_list=None, decision_tasks_timeout=None):
+                        input=None, tag_list=None, decision_tasks_timeout=None,
+                        use_cache=False):
         """Starts a Workflow execution of current workflow type
 
-        :param  workflow_id: The user defined identifier associated with the workflow execution
+        :param  workflow_id: The user defined identifier associated with the workflow execution,
+                             defaults to ``<name>-<version>-<timestamp in ms>``.
+                             Required for ``use_cache`` to apply.
         :type   workflow_id: String
 
         :param  task_list: task list to use for scheduling decision tasks for execution
@@ -251,13 +511,38 @@ class WorkflowType(BaseModel):
         :param  decision_tasks_timeout: maximum duration of decision tasks
                                         for this workflow execution
         :type   decision_tasks_timeout: String
+
+        :param  use_cache: when a workflow_id is provided, return the execution
+                           which this call already started less than
+                           ``EXECUTION_CACHE_TTL`` seconds ago with the same
+                           parameters and credentials, if any, instead of
+                           requesting amazon. That execution may have closed
+                           since, so only use it to make retries idempotent.
+        :type   use_cache: bool
         """
-        workflow_id = workflow_id or '%s-%s-%i' % (self.name, self.version, time.time())
+        fingerprint = None
+        owner = (self.domain.name, self.name, self.version)
         task_list = task_list or self.task_list
         child_policy = child_policy or self.child_policy
+
+        if workflow_id and use_cache:
+            fingerprint = _fingerprint(
+                self.connection.aws_access_key_id, self.region, owner,
+                workflow_id, task_list, child_policy, execution_timeout,
+                input, tag_list, decision_tasks_timeout,
+            )
+            started = _remembered_execution(fingerprint)
+            if started is not None:
+                return WorkflowExecution(self.domain, workflow_id,
+                                         run_id=started[2],
+                                         connection=self.connection)
+
+        # Millisecond resolution keeps default ids apart for executions
+        # started within the same second
+        workflow_id = workflow_id or '%s-%s-%i' % (self.name, self.version, time.time() * 1000)
         input = json.dumps(input) or None
 
-        run_id = self.connection.start_workflow_execution(
+        response = self.connection.start_workflow_execution(
             self.domain.name,
             workflow_id,
             self.name,
@@ -268,13 +553,25 @@ class WorkflowType(BaseModel):
             input=input,
             tag_list=tag_list,
             task_start_to_close_timeout=decision_tasks_timeout,
-        )['runId']
+        )
+
+        run_id = response.get('runId')
+        if run_id is None:
+            raise ResponseError("Missing runId in response: %r" % response)
 
-        return WorkflowExecution(self.domain, workflow_id, run_id=run_id)
+        execution = WorkflowExecution(self.domain, workflow_id, run_id=run_id)
+
+        if fingerprint is not None:
+            _remember_execution(
+                fingerprint, owner,
+                _run_key(self.domain.name, workflow_id, run_id)
+            )
+
+        return execution
 
     def __repr__(self):
-        return '<{} domain={} name={} version={} status={}>'.format(
-               self.__class__.__name__,
+        return '<%s domain=%s name=%s version=%s status=%s>' % (
+               type(self).__name__,
                self.domain.name,
                self.name,
                self.version,
@@ -310,15 +607,17 @@ class WorkflowExecution(BaseModel):
                    serialized json
     :type   input: dict
     """
-    STATUS_OPEN = "OPEN"
-    STATUS_CLOSED = "CLOSED"
-
-    CLOSE_STATUS_COMPLETED = "COMPLETED"
-    CLOSE_STATUS_FAILED = "FAILED"
-    CLOSE_STATUS_CANCELED = "CANCELED"
-    CLOSE_STATUS_TERMINATED = "TERMINATED"
-    CLOSE_STATUS_CONTINUED_AS_NEW = "CLOSE_STATUS_CONTINUED_AS_NEW"
-    CLOSE_TIMED_OUT = "TIMED_OUT"
+    # Interned so that comparisons against them, and against values
+    # interned the same way, short-circuit on identity
+    STATUS_OPEN = intern("OPEN")
+    STATUS_CLOSED = intern("CLOSED")
+
+    CLOSE_STATUS_COMPLETED = intern("COMPLETED")
+    CLOSE_STATUS_FAILED = intern("FAILED")
+    CLOSE_STATUS_CANCELED = intern("CANCELED")
+    CLOSE_STATUS_TERMINATED = intern("TERMINATED")
+    CLOSE_STATUS_CONTINUED_AS_NEW = intern("CLOSE_STATUS_CONTINUED_AS_NEW")
+    CLOSE_TIMED_OUT = intern("TIMED_OUT")
 
     kind = 'execution'
 
@@ -337,6 +636,19 @@ class WorkflowExecution(BaseModel):
         'decision_tasks_timeout',
     ]
 
+    # Compared attributes as (diff name, local attribute, path of the
+    # upstream value in amazon's describe_workflow_execution response)
+    _DIFF_SPEC = (
+        ('workflow_id', 'workflow_id', ('executionInfo', 'execution', 'workflowId')),
+        ('run_id', 'run_id', ('executionInfo', 'execution', 'runId')),
+        ('status', 'status', ('executionInfo', 'executionStatus')),
+        ('task_list', 'task_list', ('executionConfiguration', 'taskList', 'name')),
+        ('child_policy', 'child_policy', ('executionConfiguration', 'childPolicy')),
+        ('execution_timeout', 'execution_timeout', ('executionConfiguration', 'executionStartToCloseTimeout')),
+        ('tag_list', 'tag_list', ('executionInfo', 'tagList')),
+        ('decision_tasks_timeout', 'decision_tasks_timeout', ('executionConfiguration', 'taskStartToCloseTimeout')),
+    )
+
     def __init__(self, domain, workflow_id, run_id=None,
                  status=STATUS_OPEN, workflow_type=None,
                  task_list=None, child_policy=None,
@@ -365,35 +677,16 @@ class WorkflowExecution(BaseModel):
         """Checks for differences between WorkflowExecution instance
         and upstream version
 
-        :returns: A list of swf.models.base.Diff namedtuple describing
-                  differences
-        :rtype: list
+        :returns: differences between local and upstream versions
+        :rtype: swf.models.base.ModelDiff
         """
-        try:
-            description = self.connection.describe_workflow_execution(
-                self.domain.name,
-                self.run_id,
-                self.workflow_id
-            )
-        except SWFResponseError as e:
-            if e.error_code == 'UnknownResourceFault':
-                raise DoesNotExistError("Remote Domain does not exist")
-
-            raise ResponseError(e.body['message'])
-
-        execution_info = description['executionInfo']
-        execution_config = description['executionConfiguration']
-
-        return ModelDiff(
-            ('workflow_id', self.workflow_id, execution_info['execution']['workflowId']),
-            ('run_id', self.run_id, execution_info['execution']['runId']),
-            ('status', self.status, execution_info['executionStatus']),
-            ('task_list', self.task_list, execution_config['taskList']['name']),
-            ('child_policy', self.child_policy, execution_config['childPolicy']),
-            ('execution_timeout', self.execution_timeout, execution_config['executionStartToCloseTimeout']),
-            ('tag_list', self.tag_list, execution_info.get('tagList')),
-            ('decision_tasks_timeout', self.decision_tasks_timeout, execution_config['taskStartToCloseTimeout']),
-        )
+        description = _try_describe(self._describe,
+                                    "Remote WorkflowExecution does not exist")
+
+        return ModelDiff(*(
+            (attr, getattr(self, local), get_subkey(description, path))
+            for attr, local, path in self._DIFF_SPEC
+        ))
 
     @property
     @exceptions.translate(SWFResponseError, to=ResponseError)
@@ -407,48 +700,77 @@ class WorkflowExecution(BaseModel):
 
         :rtype: bool
         """
-        self.connection.describe_workflow_execution(
+        self._describe()
+        return True
+
+    def _describe(self):
+        """Fetches the workflow execution description amazon-side
+
+        Responses are shared with other calls made within the same
+        ``DESCRIPTION_CACHE_TTL`` window.
+
+        :rtype: dict
+        """
+        return _cached_describe(
+            self.connection,
+            'describe_workflow_execution',
+            self.domain.name,
+            self.run_id,
+            self.workflow_id
+        )
+
+    def invalidate(self):
+        """Drops the cached amazon-side description of the workflow execution"""
+        _invalidate(
+            self.connection,
+            'describe_workflow_execution',
             self.domain.name,
             self.run_id,
             self.workflow_id
         )
-        return True
 
     def upstream(self):
         from swf.querysets.workflow import WorkflowExecutionQuerySet
         qs = WorkflowExecutionQuerySet(self.domain)
         return qs.get(self.workflow_id, self.run_id)
 
-    def history(self, *args, **kwargs):
-        """Returns workflow execution history report
+    def _iter_events(self, domain, **kwargs):
+        """Yields the workflow execution history events, fetching
+        amazon response pages as they are consumed
 
-        :returns: The workflow execution complete events history
-        :rtype: swf.models.event.History
-        """
-        domain = kwargs.pop('domain', self.domain)
+        :param  domain: domain the workflow execution belongs to
+        :type   domain: swf.models.domain.Domain
 
-        response = self.connection.get_workflow_execution_history(
-            domain.name,
-            self.run_id,
-            self.workflow_id,
-            **kwargs
-        )
+        :rtype: generator of dict
+        """
+        next_page = None
+        while True:
+            if next_page is not None:
+                kwargs['next_page_token'] = next_page
 
-        events = response['events']
-        next_page = response.get('nextPageToken')
-        while next_page is not None:
             response = self.connection.get_workflow_execution_history(
                 domain.name,
                 self.run_id,
                 self.workflow_id,
-                next_page_token=next_page,
                 **kwargs
             )
 
-            events.extend(response['events'])
+            for event in response['events']:
+                yield event
+
             next_page = response.get('nextPageToken')
+            if next_page is None:
+                break
+
+    def history(self, *args, **kwargs):
+        """Returns workflow execution history report
+
+        :returns: The workflow execution complete events history
+        :rtype: swf.models.event.History
+        """
+        domain = kwargs.pop('domain', self.domain)
 
-        return History.from_event_list(events)
+        return History.from_event_iter(self._iter_events(domain, **kwargs))
 
     @exceptions.translate(SWFResponseError,
                           to=ResponseError)
@@ -471,12 +793,15 @@ class WorkflowExecution(BaseModel):
                        event in the target workflow execution’s history.
         :type   input: dict
         """
-        self.connection.signal_workflow_execution(
-            self.domain.name,
-            signal_name,
-            self.workflow_id,
-            input=json.dumps(input or '{}'),
-            run_id=self.run_id)
+        try:
+            self.connection.signal_workflow_execution(
+                self.domain.name,
+                signal_name,
+                self.workflow_id,
+                input=json.dumps(input or '{}'),
+                run_id=self.run_id)
+        finally:
+            self.invalidate()
 
     @exceptions.translate(SWFResponseError,
                           to=ResponseError)
@@ -486,10 +811,16 @@ class WorkflowExecution(BaseModel):
                             extract=exceptions.extract_resource))
     def request_cancel(self, *args, **kwargs):
         """Requests the workflow execution cancel"""
-        self.connection.request_cancel_workflow_execution(
-            self.domain.name,
-            self.workflow_id,
-            run_id=self.run_id)
+        try:
+            self.connection.request_cancel_workflow_execution(
+                self.domain.name,
+                self.workflow_id,
+                run_id=self.run_id)
+        finally:
+            self.invalidate()
+            _forget_execution(
+                _run_key(self.domain.name, self.workflow_id, self.run_id)
+            )
 
     @exceptions.translate(SWFResponseError,
                           to=ResponseError)
@@ -499,8 +830,14 @@ class WorkflowExecution(BaseModel):
                             extract=exceptions.extract_resource))
     def terminate(self, *args, **kwargs):
         """Terminates the workflow execution"""
-        self.connection.terminate_workflow_execution(
-            self.domain.name,
-            self.workflow_id,
-            run_id=self.run_id
-        )
+        try:
+            self.connection.terminate_workflow_execution(
+                self.domain.name,
+                self.workflow_id,
+                run_id=self.run_id
+            )
+        finally:
+            self.invalidate()
+            _forget_execution(
+                _run_key(self.domain.name, self.workflow_id, self.run_id)
+            )
@@ -167,8 +167,12 @@ def immutable(mutableclass):
     immutableclass.__name__ = mutableclass.__name__
     immutableclass.__module__ = mutableclass.__module__
 
-    # Make read-only:
+    # Make read-only. Properties without setter nor deleter already are,
+    # and are left as-is to avoid one more descriptor call on every access.
     for name, member in mutableclass.__dict__.items():
+        if (isinstance(member, property) and
+                member.fset is None and member.fdel is None):
+            continue
         if hasattr(member, '__set__'):
             setattr(immutableclass, name, property(member.__get__))
 
@@ -52,6 +52,15 @@ class TestHistory(unittest2.TestCase):
         self.assertIsInstance(val, History)
         self.assertEqual(len(val), 1)
 
+    def test_from_event_iter(self):
+        events = self.event_list['events']
+        history = History.from_event_iter(iter(events))
+
+        self.assertIsInstance(history, History)
+        self.assertEqual(len(history), len(events))
+        self.assertEqual([e.id for e in history],
+                         [e.id for e in self.history])
+
     def test_get_by_invalid_slice(self):
         h = self.history[45:99]
         self.assertIsNotNone(h)
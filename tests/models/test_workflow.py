@@ -10,6 +10,7 @@ from boto.swf.exceptions import SWFTypeAlreadyExistsError
 from swf.exceptions import AlreadyExistsError, DoesNotExistError, ResponseError
 from swf.models.history import History
 from swf.models.domain import Domain
+from swf.models import workflow
 from swf.models.workflow import WorkflowType, WorkflowExecution
 
 from ..mocks.workflow import mock_describe_workflow_type,\
@@ -17,13 +18,30 @@ from ..mocks.workflow import mock_describe_workflow_type,\
 from ..mocks.event import mock_get_workflow_execution_history
 
 
+def clear_caches():
+    workflow._descriptions.clear()
+    workflow._executions.clear()
+    workflow._executions_by_owner.clear()
+    workflow._executions_by_run.clear()
+
+
 class TestWorkflowType(unittest2.TestCase):
     def setUp(self):
         self.domain = Domain("test-domain")
         self.wt = WorkflowType(self.domain, "TestType", "1.0")
+        clear_caches()
 
     def tearDown(self):
-        pass
+        clear_caches()
+
+    def test_instances_are_slot_based(self):
+        self.assertFalse(hasattr(self.wt, '__dict__'))
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(self.wt),
+            '<WorkflowType domain=test-domain name=TestType version=1.0 status=REGISTERED>'
+        )
 
     def test_init_with_invalid_child_policy(self):
         with self.assertRaises(ValueError):
@@ -109,10 +127,34 @@ class TestWorkflowType(unittest2.TestCase):
                 self.domain.exists
 
     def test_is_synced_with_unsynced_workflow_type(self):
-        pass
+        with patch.object(
+            Layer1,
+            'describe_workflow_type',
+            mock_describe_workflow_type
+        ):
+            self.assertFalse(self.wt.is_synced)
 
     def test_is_synced_with_synced_workflow_type(self):
-        pass
+        with patch.object(
+            Layer1,
+            'describe_workflow_type',
+            mock_describe_workflow_type
+        ):
+            mocked = mock_describe_workflow_type()
+            workflow_type = WorkflowType(
+                self.domain,
+                name=mocked['typeInfo']['workflowType']['name'],
+                version=mocked['typeInfo']['workflowType']['version'],
+                status=mocked['typeInfo']['status'],
+                creation_date=mocked['typeInfo']['creationDate'],
+                deprecation_date=mocked['typeInfo']['deprecationDate'],
+                task_list=mocked['configuration']['defaultTaskList']['name'],
+                child_policy=mocked['configuration']['defaultChildPolicy'],
+                execution_timeout=mocked['configuration']['defaultExecutionStartToCloseTimeout'],
+                decision_tasks_timeout=mocked['configuration']['defaultTaskStartToCloseTimeout'],
+                description=mocked['typeInfo']['description'],
+            )
+            self.assertTrue(workflow_type.is_synced)
 
     def test_is_synced_over_non_existent_workflow_type(self):
         with patch.object(
@@ -218,6 +260,217 @@ class TestWorkflowType(unittest2.TestCase):
                 )
                 self.wt.delete()
 
+    def test_delete_with_response_error(self):
+        with patch.object(self.wt.connection, 'deprecate_workflow_type') as mock:
+            with self.assertRaises(ResponseError):
+                mock.side_effect = SWFResponseError(
+                    400,
+                    "mocked exception",
+                    {
+                        "__type": "OperationNotPermittedFault",
+                        "message": "Whatever"
+                    }
+                )
+                self.wt.delete()
+
+    def test_start_execution_default_workflow_id(self):
+        with patch.object(self.wt.connection, 'start_workflow_execution') as mock:
+            mock.return_value = {'runId': 'mocked-run-id'}
+            with patch('time.time', return_value=1365177769.585):
+                execution = self.wt.start_execution()
+
+            self.assertEqual(execution.workflow_id, 'TestType-1.0-1365177769585')
+            self.assertEqual(execution.run_id, 'mocked-run-id')
+
+    def test_start_execution_without_run_id(self):
+        with patch.object(self.wt.connection, 'start_workflow_execution') as mock:
+            mock.return_value = {}
+            with self.assertRaises(ResponseError):
+                self.wt.start_execution()
+
+    def test_bulk_exists(self):
+        def describe(domain, name, version):
+            if name == 'missing':
+                raise SWFResponseError(
+                    400,
+                    "Bad Request:",
+                    {'__type': 'com.amazonaws.swf.base.model#UnknownResourceFault',
+                     'message': 'Unknown type: WorkflowType=[name=missing, version=1.0]'},
+                    'UnknownResourceFault',
+                )
+            return mock_describe_workflow_type()
+
+        missing = WorkflowType(self.domain, "missing", "1.0")
+        with patch.object(Layer1, 'describe_workflow_type') as mock:
+            mock.side_effect = describe
+            result = WorkflowType.bulk_exists([self.wt, missing])
+
+            self.assertEqual(result, {self.wt: True, missing: False})
+
+            # Descriptions are cached for following calls
+            self.wt.changes
+            self.assertEqual(mock.call_count, 2)
+
+    def test_bulk_exists_with_invalid_max_workers(self):
+        with self.assertRaises(ValueError):
+            WorkflowType.bulk_exists([self.wt], max_workers=0)
+
+    def test_bulk_exists_with_response_error(self):
+        with patch.object(Layer1, 'describe_workflow_type') as mock:
+            mock.side_effect = SWFResponseError(
+                400,
+                "mocked exception",
+                {
+                    '__type': 'WhateverError',
+                    'message': 'Whatever'
+                }
+            )
+            with self.assertRaises(ResponseError):
+                WorkflowType.bulk_exists([
+                    self.wt,
+                    WorkflowType(self.domain, "OtherType", "1.0"),
+                ])
+
+    def test_bulk_exists_without_workflow_types(self):
+        self.assertEqual(WorkflowType.bulk_exists([]), {})
+
+    def test_start_execution_restarts_by_default(self):
+        with patch.object(self.wt.connection, 'start_workflow_execution') as mock:
+            mock.side_effect = [{'runId': 'run-1'}, {'runId': 'run-2'}]
+            first = self.wt.start_execution('nightly')
+            second = self.wt.start_execution('nightly')
+
+            self.assertEqual(first.run_id, 'run-1')
+            self.assertEqual(second.run_id, 'run-2')
+            self.assertEqual(mock.call_count, 2)
+
+    def test_start_execution_retry_returns_started_execution(self):
+        with patch.object(self.wt.connection, 'start_workflow_execution') as mock:
+            mock.return_value = {'runId': 'mocked-run-id'}
+            first = self.wt.start_execution('retried-id', input={'a': 1},
+                                            use_cache=True)
+            second = self.wt.start_execution('retried-id', input={'a': 1},
+                                             use_cache=True)
+
+            self.assertEqual(second.workflow_id, first.workflow_id)
+            self.assertEqual(second.run_id, first.run_id)
+            self.assertIs(second.connection, self.wt.connection)
+            self.assertEqual(mock.call_count, 1)
+
+            self.wt.start_execution('retried-id', input={'a': 2},
+                                    use_cache=True)
+            self.assertEqual(mock.call_count, 2)
+
+    def test_start_execution_retry_with_other_credentials(self):
+        other = WorkflowType(
+            self.domain, "TestType", "1.0",
+            connection=Layer1(aws_access_key_id='other',
+                              aws_secret_access_key='other')
+        )
+        with patch.object(Layer1, 'start_workflow_execution') as mock:
+            mock.return_value = {'runId': 'mocked-run-id'}
+            self.wt.start_execution('retried-id', use_cache=True)
+            other.start_execution('retried-id', use_cache=True)
+
+            self.assertEqual(mock.call_count, 2)
+
+    def test_start_execution_cache_expires(self):
+        ttl = workflow.EXECUTION_CACHE_TTL
+        with patch.object(self.wt.connection, 'start_workflow_execution') as mock:
+            mock.return_value = {'runId': 'mocked-run-id'}
+            with patch('time.time', return_value=1000.0):
+                self.wt.start_execution('expired-id', use_cache=True)
+            with patch('time.time', return_value=1000.0 + ttl):
+                self.wt.start_execution('retried-id', use_cache=True)
+                self.wt.start_execution('expired-id', use_cache=True)
+
+            self.assertEqual(mock.call_count, 3)
+            self.assertEqual(len(workflow._executions), 2)
+
+    def test_start_execution_cache_is_bounded(self):
+        with patch.object(workflow, 'EXECUTION_CACHE_SIZE', 2):
+            with patch.object(self.wt.connection, 'start_workflow_execution') as mock:
+                mock.return_value = {'runId': 'mocked-run-id'}
+                for workflow_id in ('first-id', 'second-id', 'third-id'):
+                    self.wt.start_execution(workflow_id, use_cache=True)
+
+                self.assertEqual(len(workflow._executions), 2)
+
+                self.wt.start_execution('first-id', use_cache=True)
+                self.assertEqual(mock.call_count, 4)
+
+    def test_start_execution_with_default_workflow_id_is_not_cached(self):
+        with patch.object(self.wt.connection, 'start_workflow_execution') as mock:
+            mock.return_value = {'runId': 'mocked-run-id'}
+            self.wt.start_execution(use_cache=True)
+            self.wt.start_execution(use_cache=True)
+
+            self.assertEqual(mock.call_count, 2)
+
+    def test_delete_forgets_started_executions(self):
+        with patch.object(self.wt.connection, 'start_workflow_execution') as mock:
+            mock.return_value = {'runId': 'mocked-run-id'}
+            self.wt.start_execution('deleted-id', use_cache=True)
+            with patch.object(self.wt.connection, 'deprecate_workflow_type'):
+                self.wt.delete()
+            self.wt.start_execution('deleted-id', use_cache=True)
+
+            self.assertEqual(mock.call_count, 2)
+
+    def test_changes_over_unknown_workflow_type(self):
+        with patch.object(self.wt.connection, 'describe_workflow_type') as mock:
+            mock.side_effect = SWFResponseError(
+                    400,
+                    "Bad Request:",
+                    {'__type': 'com.amazonaws.swf.base.model#UnknownResourceFault',
+                     'message': 'Unknown type: WorkflowType=[name=TestType, version=1.0]'},
+                    'UnknownResourceFault',
+                )
+
+            with self.assertRaises(DoesNotExistError):
+                self.wt.changes
+
+    def test_exists_then_changes_describes_once(self):
+        with patch.object(self.wt.connection, 'describe_workflow_type') as mock:
+            mock.return_value = mock_describe_workflow_type()
+            self.assertTrue(self.wt.exists)
+            self.wt.changes
+            self.assertEqual(mock.call_count, 1)
+
+    def test_save_invalidates_description_once_registered(self):
+        def register(*args, **kwargs):
+            # A concurrent describe while amazon registers the type
+            self.wt.exists
+
+        with patch.object(self.wt.connection, 'describe_workflow_type') as describe:
+            describe.return_value = mock_describe_workflow_type()
+            with patch.object(self.wt.connection, 'register_workflow_type') as mock:
+                mock.side_effect = register
+                self.wt.save()
+
+            self.wt.exists
+            self.assertEqual(describe.call_count, 2)
+
+    def test_descriptions_expire_with_their_window(self):
+        ttl = workflow.DESCRIPTION_CACHE_TTL
+        with patch.object(self.wt.connection, 'describe_workflow_type') as mock:
+            mock.return_value = mock_describe_workflow_type()
+            with patch('time.time', return_value=ttl * 1000):
+                self.assertTrue(self.wt.exists)
+            with patch('time.time', return_value=ttl * 1001):
+                self.assertTrue(self.wt.exists)
+
+            self.assertEqual(mock.call_count, 2)
+            self.assertEqual(len(workflow._descriptions), 1)
+
+    def test_invalidate_drops_cached_description(self):
+        with patch.object(self.wt.connection, 'describe_workflow_type') as mock:
+            mock.return_value = mock_describe_workflow_type()
+            self.assertTrue(self.wt.exists)
+            self.wt.invalidate()
+            self.assertTrue(self.wt.exists)
+            self.assertEqual(mock.call_count, 2)
+
 
 class TestWorkflowExecution(unittest2.TestCase):
     def setUp(self):
@@ -228,9 +481,10 @@ class TestWorkflowExecution(unittest2.TestCase):
             self.wt,
             "TestType-0.1-TestDomain"
         )
+        clear_caches()
 
     def tearDown(self):
-        pass
+        clear_caches()
 
     def test_instantiation(self):
         we = WorkflowExecution(
@@ -245,6 +499,9 @@ class TestWorkflowExecution(unittest2.TestCase):
             WorkflowExecution.STATUS_CLOSED
         ])
 
+    def test_instances_are_slot_based(self):
+        self.assertFalse(hasattr(self.we, '__dict__'))
+
     def test___diff_with_different_workflow_execution(self):
         with patch.object(
             Layer1,
@@ -318,10 +575,32 @@ class TestWorkflowExecution(unittest2.TestCase):
                 self.domain.exists
 
     def test_is_synced_with_unsynced_workflow_execution(self):
-        pass
+        with patch.object(
+            Layer1,
+            'describe_workflow_execution',
+            mock_describe_workflow_execution
+        ):
+            self.assertFalse(self.we.is_synced)
 
     def test_is_synced_with_synced_workflow_execution(self):
-        pass
+        with patch.object(
+            Layer1,
+            'describe_workflow_execution',
+            mock_describe_workflow_execution
+        ):
+            mocked = mock_describe_workflow_execution()
+            workflow_execution = WorkflowExecution(
+                self.domain,
+                mocked['executionInfo']['execution']['workflowId'],
+                run_id=mocked['executionInfo']['execution']['runId'],
+                status=mocked['executionInfo']['executionStatus'],
+                task_list=mocked['executionConfiguration']['taskList']['name'],
+                child_policy=mocked['executionConfiguration']['childPolicy'],
+                execution_timeout=mocked['executionConfiguration']['executionStartToCloseTimeout'],
+                tag_list=mocked['executionInfo']['tagList'],
+                decision_tasks_timeout=mocked['executionConfiguration']['taskStartToCloseTimeout'],
+            )
+            self.assertTrue(workflow_execution.is_synced)
 
     def test_is_synced_over_non_existent_workflow_execution(self):
         with patch.object(
@@ -387,3 +666,43 @@ class TestWorkflowExecution(unittest2.TestCase):
         ):
             history = self.we.history()
             self.assertIsInstance(history, History)
+
+    def test_exists_then_changes_describes_once(self):
+        with patch.object(self.we.connection, 'describe_workflow_execution') as mock:
+            mock.return_value = mock_describe_workflow_execution()
+            self.assertTrue(self.we.exists)
+            self.we.changes
+            self.assertEqual(mock.call_count, 1)
+
+    def test_history_fetches_every_page(self):
+        first_page = mock_get_workflow_execution_history(
+            override_data={'nextPageToken': 'mocked-token'}
+        )
+        last_page = mock_get_workflow_execution_history()
+
+        with patch.object(
+            self.we.connection,
+            'get_workflow_execution_history'
+        ) as mock:
+            mock.side_effect = [first_page, last_page]
+            history = self.we.history()
+
+            self.assertEqual(mock.call_count, 2)
+            self.assertEqual(
+                mock.call_args[1],
+                {'next_page_token': 'mocked-token'}
+            )
+            self.assertEqual(
+                len(history),
+                len(first_page['events']) + len(last_page['events'])
+            )
+
+    def test_terminate_forgets_started_execution(self):
+        with patch.object(self.wt.connection, 'start_workflow_execution') as mock:
+            mock.return_value = {'runId': 'mocked-run-id'}
+            execution = self.wt.start_execution('terminated-id', use_cache=True)
+            with patch.object(execution.connection, 'terminate_workflow_execution'):
+                execution.terminate()
+            self.wt.start_execution('terminated-id', use_cache=True)
+
+            self.assertEqual(mock.call_count, 2)
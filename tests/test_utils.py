@@ -62,4 +62,42 @@ class TestUtils(unittest2.TestCase):
         }
 
 
-        self.assertIsNone(get_subkey(base_dict, ['b', '1']))
\ No newline at end of file
+        self.assertIsNone(get_subkey(base_dict, ['b', '1']))
+
+    def test_immutable_forbids_slots_assignment(self):
+        @immutable
+        class Point(object):
+            __slots__ = ['x']
+
+            def __init__(self, x):
+                self.x = x
+
+            @property
+            def double(self):
+                """Twice x"""
+                return self.x * 2
+
+            def _del_label(self):
+                pass
+
+            label = property(lambda self: 'point', fdel=_del_label)
+
+        point = Point(21)
+        self.assertEqual(point.double, 42)
+        self.assertEqual(point.label, 'point')
+
+        with self.assertRaises(AttributeError):
+            point.x = 0
+
+        with self.assertRaises(AttributeError):
+            point.double = 0
+
+        with self.assertRaises(AttributeError):
+            del point.double
+
+        # Properties with a deleter are locked down too
+        with self.assertRaises(AttributeError):
+            del point.label
+
+        # Read-only properties keep their documentation
+        self.assertEqual(Point.double.__doc__, "Twice x")